@@ -7,6 +7,7 @@ with proper great circle interpolation and polar distortion compensation.
 """
 
 import argparse
+import importlib.util
 import math
 import numpy as np
 from PIL import Image, ImageDraw, ImageColor
@@ -31,7 +32,7 @@ C2 = (5 + math.sqrt(5)) / 4
 C3 = (2 + math.sqrt(5)) / 2
 C4 = 3 * (1 + math.sqrt(5)) / 4
 
-VERTICES = [
+VERTICES = np.array([
     ( 0.5,  0.0,   C4), ( 0.5,  0.0,  -C4), (-0.5,  0.0,   C4), (-0.5,  0.0,  -C4), (  C4,  0.5,  0.0), (  C4, -0.5,  0.0), ( -C4,  0.5,  0.0),
     ( -C4, -0.5,  0.0), ( 0.0,   C4,  0.5), ( 0.0,   C4, -0.5), ( 0.0,  -C4,  0.5), ( 0.0,  -C4, -0.5), ( 1.0,   C0,   C3), ( 1.0,   C0,  -C3),
     ( 1.0,  -C0,   C3), ( 1.0,  -C0,  -C3), (-1.0,   C0,   C3), (-1.0,   C0,  -C3), (-1.0,  -C0,   C3), (-1.0,  -C0,  -C3), (  C3,  1.0,   C0),
@@ -41,54 +42,188 @@ VERTICES = [
     (-0.5,  -C1,   C2), (-0.5,  -C1,  -C2), (  C2,  0.5,   C1), (  C2,  0.5,  -C1), (  C2, -0.5,   C1), (  C2, -0.5,  -C1), ( -C2,  0.5,   C1),
     ( -C2,  0.5,  -C1), ( -C2, -0.5,   C1), ( -C2, -0.5,  -C1), (  C1,   C2,  0.5), (  C1,   C2, -0.5), (  C1,  -C2,  0.5), (  C1,  -C2, -0.5),
     ( -C1,   C2,  0.5), ( -C1,   C2, -0.5), ( -C1,  -C2,  0.5), ( -C1,  -C2, -0.5),
-]
-
-FACES = [
-    [  0,  2, 18, 42, 38, 14 ], [  0,  2, 18, 42, 38, 14 ], [  1,  3, 17, 41, 37, 13 ],
-    [  2,  0, 12, 36, 40, 16 ], [  3,  1, 15, 39, 43, 19 ], [  4,  5, 23, 47, 45, 21 ],
-    [  5,  4, 20, 44, 46, 22 ], [  6,  7, 26, 50, 48, 24 ], [  7,  6, 25, 49, 51, 27 ],
-    [  8,  9, 33, 57, 56, 32 ], [  9,  8, 28, 52, 53, 29 ], [ 10, 11, 31, 55, 54, 30 ],
-    [ 11, 10, 34, 58, 59, 35 ], [ 12, 44, 20, 52, 28, 36 ], [ 13, 37, 29, 53, 21, 45 ],
-    [ 14, 38, 30, 54, 22, 46 ], [ 15, 47, 23, 55, 31, 39 ], [ 16, 40, 32, 56, 24, 48 ],
-    [ 17, 49, 25, 57, 33, 41 ], [ 18, 50, 26, 58, 34, 42 ], [ 19, 43, 35, 59, 27, 51 ],
-
+])
+
+HEX_FACES = np.array([
+    [  0,  2, 18, 42, 38, 14 ], [  1,  3, 17, 41, 37, 13 ], [  2,  0, 12, 36, 40, 16 ],
+    [  3,  1, 15, 39, 43, 19 ], [  4,  5, 23, 47, 45, 21 ], [  5,  4, 20, 44, 46, 22 ],
+    [  6,  7, 26, 50, 48, 24 ], [  7,  6, 25, 49, 51, 27 ], [  8,  9, 33, 57, 56, 32 ],
+    [  9,  8, 28, 52, 53, 29 ], [ 10, 11, 31, 55, 54, 30 ], [ 11, 10, 34, 58, 59, 35 ],
+    [ 12, 44, 20, 52, 28, 36 ], [ 13, 37, 29, 53, 21, 45 ], [ 14, 38, 30, 54, 22, 46 ],
+    [ 15, 47, 23, 55, 31, 39 ], [ 16, 40, 32, 56, 24, 48 ], [ 17, 49, 25, 57, 33, 41 ],
+    [ 18, 50, 26, 58, 34, 42 ], [ 19, 43, 35, 59, 27, 51 ],
+], dtype=np.int32)
+
+PENT_FACES = np.array([
     [  0, 14, 46, 44, 12 ], [  1, 13, 45, 47, 15 ], [  2, 16, 48, 50, 18 ],
     [  3, 19, 51, 49, 17 ], [  4, 21, 53, 52, 20 ], [  5, 22, 54, 55, 23 ],
     [  6, 24, 56, 57, 25 ], [  7, 27, 59, 58, 26 ], [  8, 32, 40, 36, 28 ],
     [  9, 29, 37, 41, 33 ], [ 10, 30, 38, 42, 34 ], [ 11, 35, 43, 39, 31 ],
-]
-
+], dtype=np.int32)
 
-def xyz_to_lonlat(x, y, z):
-    # Normalize to unit sphere
-    r = math.sqrt(x*x + y*y + z*z)
-    x, y, z = x/r, y/r, z/r
 
-    # Convert to longitude and latitude
-    lon = math.atan2(y, x)
-    lat = math.asin(z)
+def face_edges(faces):
+    # (start, end) vertex index pairs of all edges of faces given as array rows
+    return np.stack([faces, np.roll(faces, -1, axis=1)], axis=-1).reshape(-1, 2)
 
-    # Convert to degrees
-    lon_deg = math.degrees(lon)
-    lat_deg = math.degrees(lat)
 
+def xyz_to_lonlat(points):
+    # Longitude and latitude in degrees of points with shape (..., 3), need not be normalized
+    x, y, z = points[..., 0], points[..., 1], points[..., 2]
+    lon_deg = np.degrees(np.arctan2(y, x))
+    lat_deg = np.degrees(np.arctan2(z, np.hypot(x, y)))
     return lon_deg, lat_deg
 
 
 def lonlat_to_xy(lon_deg, lat_deg, width, height):
-    lon_rad = math.radians(lon_deg)
-    lat_rad = math.radians(lat_deg)
-    u = int((lon_rad + math.pi) / (2*math.pi) * width)
-    v = int((math.pi/2 - lat_rad) / math.pi * height)
+    # Works for scalars and NumPy arrays alike
+    lon_rad = np.radians(lon_deg)
+    lat_rad = np.radians(lat_deg)
+    u = ((lon_rad + np.pi) / (2*np.pi) * width).astype(int)
+    v = ((np.pi/2 - lat_rad) / np.pi * height).astype(int)
     u = u % width
-    v = max(0, min(height-1, v))
+    v = np.clip(v, 0, height-1)
+    return u, v
+
+
+def resample_polylines(lon_deg, lat_deg, width, height):
+    # Resample polylines given by rows of lon/lat points about one pixel apart, so that edges
+    # are continuous strokes for any interpolation density while dense samples are not drawn
+    # over and over again; polylines are unwrapped across the texture seam
+    u = np.unwrap((lon_deg + 180) / 360 * width, period=width, axis=1)
+    v = (90 - lat_deg) / 180 * height
+
+    resampled_u, resampled_v = [], []
+    for row_u, row_v in zip(u, v):
+        dist = np.concatenate([[0], np.cumsum(np.hypot(np.diff(row_u), np.diff(row_v)))])
+        at = np.append(np.arange(0, dist[-1], 1.0), dist[-1])
+        resampled_u.append(np.interp(at, dist, row_u))
+        resampled_v.append(np.interp(at, dist, row_v))
+
+    lon_deg = np.concatenate(resampled_u) / width * 360 - 180
+    lat_deg = 90 - np.concatenate(resampled_v) / height * 180
+    return lon_deg, lat_deg
+
+
+def fill_ellipses(pixels, px, py, rx, ry, color):
+    # Fill axis-aligned ellipses centered at (px[k], py[k]) with horizontal radii rx[k]
+    # and vertical radius ry, wrapping around horizontally like the texture does.
+    # Every ellipse is split into 2*ry+1 horizontal runs which are accumulated in a
+    # per-row difference array, so all ellipses are drawn with a few array operations.
+    height, width = pixels.shape[:2]
+
+    dy = np.arange(-ry, ry + 1)
+    half = np.floor((rx[:, None] + 0.5) * np.sqrt(1 - (dy / (ry + 0.5))**2)).astype(int)
+    y = (py[:, None] + dy).ravel()
+    x0 = (px[:, None] - half).ravel()
+    x1 = (px[:, None] + half).ravel()
+
+    inside = (y >= 0) & (y < height)
+    y, x0, x1 = y[inside], x0[inside], x1[inside]
+
+    # Runs covering the whole row, others are wrapped around the texture seam
+    full = x1 - x0 + 1 >= width
+    x0 = np.where(full, 0, x0 % width)
+    x1 = np.where(full, width - 1, x1 % width)
+    wrapped = x0 > x1
+
+    diff = np.zeros((height, width + 1), dtype=np.int32)
+    np.add.at(diff, (y, x0), 1)
+    np.add.at(diff, (y, x1 + 1), -1)
+    np.add.at(diff, (y[wrapped], 0), 1)
+    np.add.at(diff, (y[wrapped], width), -1)
+
+    pixels[diff.cumsum(axis=1)[:, :width] > 0] = color
+
+
+def unwrapped_outline(lon_deg, lat_deg, width, height):
+    # Pixel outline of a closed spherical polygon given by its boundary samples, unwrapped
+    # across the texture seam so that its mean u is within [0, width); outlines going
+    # around a pole are closed along the pole row
+    u = np.unwrap((lon_deg + 180) / 360 * width, period=width)
+    v = (90 - lat_deg) / 180 * height
+
+    if abs(u[-1] - u[0]) > width / 2:
+        pole_v = 0 if np.mean(lat_deg) > 0 else height
+        u = np.append(u, [u[-1], u[0]])
+        v = np.append(v, [pole_v, pole_v])
+
+    u -= np.mean(u) // width * width
     return u, v
 
+
+def slerp_kernel(p1, p2, f):
+    # Scalar SLERP loop, the same result as slerp() but meant to be compiled with Numba
+    points = np.empty((p1.shape[0], f.shape[0], 3))
+    for k in range(p1.shape[0]):
+        # Per edge invariants, hoisted out of the sample loop
+        cos_c = p1[k, 0] * p2[k, 0] + p1[k, 1] * p2[k, 1] + p1[k, 2] * p2[k, 2]
+        sin_c = math.sqrt(max(0.0, 1.0 - cos_c*cos_c))
+        c = math.atan2(sin_c, cos_c)
+        lerp = sin_c < 1e-6
+        if lerp and cos_c < 0:
+            raise ValueError("SLERP between antipodal points is undefined")
+        inv_sin_c = 1.0 / sin_c if not lerp else 1.0
+
+        for j in range(f.shape[0]):
+            if lerp:
+                a = 1.0 - f[j]
+                b = f[j]
+            else:
+                a = math.sin((1-f[j]) * c) * inv_sin_c
+                b = math.sin(f[j] * c) * inv_sin_c
+            for i in range(3):
+                points[k, j, i] = a * p1[k, i] + b * p2[k, i]
+
+            if lerp:
+                norm = math.sqrt(points[k, j, 0]**2 + points[k, j, 1]**2 + points[k, j, 2]**2)
+                for i in range(3):
+                    points[k, j, i] /= norm
+    return points
+
+
+_compiled_slerp_kernel = None
+
+
+def compiled_slerp_kernel():
+    # Compile slerp_kernel() on first use, Numba is optional and its import and JIT
+    # cost much more than the NumPy path saves in a single run
+    global _compiled_slerp_kernel
+    if _compiled_slerp_kernel is None:
+        from numba import njit
+        _compiled_slerp_kernel = njit(cache=True, fastmath=True)(slerp_kernel)
+    return _compiled_slerp_kernel
+
+
+def slerp(p1, p2, f, use_numba=False):
+    # Spherical linear interpolation between unit vectors p1[k] and p2[k],
+    # returns points of shape (len(p1), len(f), 3)
+    if use_numba:
+        return compiled_slerp_kernel()(p1, p2, f)
+
+    cos_c = (p1 * p2).sum(axis=-1)
+    sin_c = np.sqrt(np.maximum(0, 1 - cos_c*cos_c))  # sin(arccos(x)) = sqrt(1 - x^2)
+    c = np.arctan2(sin_c, cos_c)[:, None]
+
+    # Nearly coincident endpoints make SLERP weights unstable, use normalized LERP for them,
+    # nearly antipodal endpoints have no unique great circle between them
+    lerp = sin_c < 1e-6
+    if np.any(lerp & (cos_c < 0)):
+        raise ValueError("SLERP between antipodal points is undefined")
+    sin_c = np.where(lerp, 1, sin_c)[:, None]
+    a = np.where(lerp[:, None], 1-f, np.sin((1-f) * c) / sin_c)
+    b = np.where(lerp[:, None], f, np.sin(f * c) / sin_c)
+
+    points = a[..., None] * p1[:, None, :] + b[..., None] * p2[:, None, :]
+    points[lerp] /= np.linalg.norm(points[lerp], axis=-1, keepdims=True)
+    return points
+
+
 def main(file_name=None, edge_thickness=EDGE_THICK, width=DEFAULT_WIDTH,
          height=DEFAULT_HEIGHT, bg_color=DEFAULT_BG_COLOR,
          pentagon_color=DEFAULT_PENTAGON_COLOR, edge_color=None,
          interpolation_points=INTERPOLATION_POINTS, lat_rotation=DEFAULT_LAT_ROTATION,
-         lon_rotation=DEFAULT_LON_ROTATION):
+         lon_rotation=DEFAULT_LON_ROTATION, use_numba=False):
 
     # Convert color names to RGB tuples
     bg_rgb = ImageColor.getrgb(bg_color)
@@ -96,134 +231,74 @@ def main(file_name=None, edge_thickness=EDGE_THICK, width=DEFAULT_WIDTH,
     edge_rgb = ImageColor.getrgb(edge_color if edge_color else pentagon_color)
 
     # Create background
-    img = Image.new("RGB", (width, height), bg_rgb)
-    draw = ImageDraw.Draw(img)
-
-    # Force background fill
-    draw.rectangle([(0, 0), (width-1, height-1)], fill=bg_rgb)
-
-    # Convert vertices to longitude/latitude array with 3D rotation
-    vertex_lonlat = []
-    lat_rot_rad = math.radians(lat_rotation)  # X-axis rotation (latitude)
-    lon_rot_rad = math.radians(lon_rotation)  # Y-axis rotation (longitude)
-
-    for x, y, z in VERTICES:
-        # Apply rotation matrix around X-axis (latitude rotation)
-        x1 = x
-        y1 = y * math.cos(lat_rot_rad) - z * math.sin(lat_rot_rad)
-        z1 = y * math.sin(lat_rot_rad) + z * math.cos(lat_rot_rad)
-
-        # Apply rotation matrix around Y-axis (longitude rotation)
-        x_rot = x1 * math.cos(lon_rot_rad) + z1 * math.sin(lon_rot_rad)
-        y_rot = y1
-        z_rot = -x1 * math.sin(lon_rot_rad) + z1 * math.cos(lon_rot_rad)
-
-        # Convert rotated coordinates to lon/lat
-        lon, lat = xyz_to_lonlat(x_rot, y_rot, z_rot)
-        vertex_lonlat.append((lon, lat))
-
-    # Connect vertices using FACES
-    for face in FACES:
-        face_list = list(face)  # Convert set to list
-        face_list.append(face_list[0])  # Close the face
-
-        # Draw lines connecting vertices in the face
-        for i in range(len(face_list) - 1):
-            start_idx = face_list[i]
-            end_idx = face_list[i + 1]
-
-            points = []
-            start_lon, start_lat = vertex_lonlat[start_idx]
-            end_lon, end_lat = vertex_lonlat[end_idx]
-
-            # Convert to radians
-            lat1 = math.radians(start_lat)
-            lon1 = math.radians(start_lon)
-            lat2 = math.radians(end_lat)
-            lon2 = math.radians(end_lon)
-
-            # Calculate the great circle distance using haversine formula
-            dlat = lat2 - lat1
-            dlon = lon2 - lon1
-            a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-            c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-
-            for j in range(interpolation_points):
-                f = j / (interpolation_points - 1)  # Interpolation parameter 0 to 1
-
-                # Spherical linear interpolation (SLERP)
-                a = math.sin((1-f) * c) / math.sin(c)
-                b = math.sin(f * c) / math.sin(c)
-
-                # Convert to Cartesian coordinates
-                x = a * math.cos(lat1) * math.cos(lon1) + b * math.cos(lat2) * math.cos(lon2)
-                y = a * math.cos(lat1) * math.sin(lon1) + b * math.cos(lat2) * math.sin(lon2)
-                z = a * math.sin(lat1) + b * math.sin(lat2)
-
-                # Convert back to spherical coordinates
-                lat = math.atan2(z, math.sqrt(x*x + y*y))
-                lon = math.atan2(y, x)
-
-                # Convert back to degrees
-                lat_deg = math.degrees(lat)
-                lon_deg = math.degrees(lon)
-                points.append((lon_deg, lat_deg))
-
-            for lon, lat in points:
-                px, py = lonlat_to_xy(lon, lat, width, height)
-                # Latitude-adjusted radius based on latitude (bigger near poles)
-                lat_factor = 1.0 / max(0.001, math.cos(math.radians(abs(lat))))  # bigger at poles
-                lat_adjusted_radius = int(edge_thickness * lat_factor)
-
-                # Draw circle at each point
-                draw.ellipse((px-lat_adjusted_radius, py-edge_thickness, px+lat_adjusted_radius, py+edge_thickness), fill=edge_rgb)
-
-    # Flood fill pentagons with black
-    for face in FACES:
-        face_list = list(face)
-
-        # HACK: Fixed margin for edge detection - not a solid solution for all pentagon splits
-        # Changin rotation may cause flood fill corruption
-        # TODO: fix it
-        margin = int(0.08 * width)
-
-        if len(face_list) == 5:  # Pentagon
-            # Calculate center point handling longitude wrap-around
-            u_coords = []
-            v_coords = []
-            for vertex_idx in face_list:
-                lon, lat = vertex_lonlat[vertex_idx]
-                u, v = lonlat_to_xy(lon, lat, width, height)
-                u_coords.append(u)
-                v_coords.append(v)
-
-            # Check for wrap-around in u coordinates (longitude boundary)
-            min_u, max_u = min(u_coords), max(u_coords)
-            if max_u - min_u > width / 2:
-                # Wrap-around detected, adjust coordinates
-                adjusted_u = []
-                for u in u_coords:
-                    if u < width / 2:
-                        adjusted_u.append(u + width)  # Move to right side
-                    else:
-                        adjusted_u.append(u)
-                center_u = int(sum(adjusted_u) / 5) % width
-            else:
-                center_u = int(sum(u_coords) / 5)
-
-            center_v = int(sum(v_coords) / 5)
-
-            # Flood fill from center
-            ImageDraw.floodfill(img, (center_u, center_v), pentagon_rgb)
-
-            # If center is near left edge, also flood fill from corresponding right edge
-            if center_u < margin:
-                mirror_u = width - 1
-                ImageDraw.floodfill(img, (mirror_u, center_v), pentagon_rgb)
-            # If center is near right edge, also flood fill from corresponding left edge
-            elif center_u > width - margin:
-                mirror_u = 1
-                ImageDraw.floodfill(img, (mirror_u, center_v), pentagon_rgb)
+    pixels = np.full((height, width, 3), bg_rgb, dtype=np.uint8)
+
+    # Compose rotations around X-axis (latitude) and then Y-axis (longitude)
+    lat_rot_rad = math.radians(lat_rotation)
+    lon_rot_rad = math.radians(lon_rotation)
+    rx = np.array([
+        [1.0, 0.0, 0.0],
+        [0.0, math.cos(lat_rot_rad), -math.sin(lat_rot_rad)],
+        [0.0, math.sin(lat_rot_rad), math.cos(lat_rot_rad)],
+    ])
+    ry = np.array([
+        [math.cos(lon_rot_rad), 0.0, math.sin(lon_rot_rad)],
+        [0.0, 1.0, 0.0],
+        [-math.sin(lon_rot_rad), 0.0, math.cos(lon_rot_rad)],
+    ])
+    rotation = ry @ rx
+
+    # Rotate all vertices and normalize to unit sphere, SLERP consumes these vectors directly
+    # and only the interpolated points are converted to lon/lat
+    rotated = VERTICES @ rotation.T
+    rotated /= np.linalg.norm(rotated, axis=1, keepdims=True)
+
+    # Interpolation parameter 0 to 1, shared by all edges
+    f = np.linspace(0, 1, interpolation_points)
+
+    # Connect vertices: (start, end) index pairs of every edge once, each edge is shared
+    # by two faces. Pentagons do not share edges, so their edges in face order come first,
+    # followed by the remaining edges between two hexagons.
+    pent_edges = face_edges(PENT_FACES)
+    pent_pairs = {frozenset(edge) for edge in pent_edges.tolist()}
+    hex_pairs = {frozenset(edge) for edge in face_edges(HEX_FACES).tolist()} - pent_pairs
+    edges = np.concatenate([pent_edges, sorted(sorted(pair) for pair in hex_pairs)])
+
+    # Interpolate all edges at once and convert back to spherical coordinates in degrees
+    points = slerp(rotated[edges[:, 0]], rotated[edges[:, 1]], f, use_numba)
+    lon_deg, lat_deg = xyz_to_lonlat(points)
+
+    # Fill pentagons first so that edges are drawn over them, the outline of a pentagon
+    # is made of the interpolated points of its edges. Each pentagon is drawn once into the
+    # middle tile of a three times wider mask, parts beyond the texture seam land in the
+    # side tiles and are merged back.
+    mask = Image.new("L", (3 * width, height), 0)
+    draw = ImageDraw.Draw(mask)
+    pent_lon = lon_deg[:PENT_FACES.size].reshape(len(PENT_FACES), -1)
+    pent_lat = lat_deg[:PENT_FACES.size].reshape(len(PENT_FACES), -1)
+    for outline in zip(pent_lon, pent_lat):
+        u, v = unwrapped_outline(*outline, width, height)
+        draw.polygon(list(zip((u + width).tolist(), v.tolist())), fill=255)
+    tiles = np.asarray(mask).reshape(height, 3, width)
+    pixels[tiles.any(axis=1)] = pentagon_rgb
+
+    # Draw every edge as a polyline through its interpolated points
+    stroke_lon, stroke_lat = resample_polylines(lon_deg, lat_deg, width, height)
+    px, py = lonlat_to_xy(stroke_lon, stroke_lat, width, height)
+
+    # Latitude-adjusted radius (bigger near poles): horizontal half-width of a spherical cap
+    # with the angular size of the edge thickness, caps covering a pole take the whole row
+    cap_sin = math.sin(edge_thickness * math.pi / height)
+    cap_ratio = cap_sin / np.maximum(1e-12, np.cos(np.radians(stroke_lat)))
+    lat_adjusted_radius = np.where(
+        cap_ratio < 1,
+        np.arcsin(np.minimum(cap_ratio, 1)) * width / (2*math.pi),
+        width,
+    )
+
+    # Draw ellipse at each polyline point
+    fill_ellipses(pixels, px, py, lat_adjusted_radius, edge_thickness, edge_rgb)
+    img = Image.fromarray(pixels)
 
     if file_name is None:
         return img
@@ -252,8 +327,13 @@ if __name__ == '__main__':
                        help=f'Latitude rotation in degrees (default: {DEFAULT_LAT_ROTATION})')
     parser.add_argument('--lon-rotation', type=int, default=DEFAULT_LON_ROTATION,
                        help=f'Longitude rotation in degrees (default: {DEFAULT_LON_ROTATION})')
+    parser.add_argument('--numba', action='store_true',
+                       help='Compile edge interpolation with Numba, pays off only for huge -i values')
     args = parser.parse_args()
 
+    if args.numba and importlib.util.find_spec('numba') is None:
+        parser.error("--numba requires the numba package")
+
     # Parse size argument
     if 'x' in args.size:
         width, height = map(int, args.size.split('x'))
@@ -261,4 +341,4 @@ if __name__ == '__main__':
         width = int(args.size)
         height = width // 2
 
-    main(args.output, args.thickness, width, height, args.bg_color, args.pentagon_color, args.edge_color, args.interpolation, args.lat_rotation, args.lon_rotation)
+    main(args.output, args.thickness, width, height, args.bg_color, args.pentagon_color, args.edge_color, args.interpolation, args.lat_rotation, args.lon_rotation, args.numba)
@@ -10,6 +10,8 @@ import pyvista as pv
 import numpy as np
 import sys
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import util
 from pathlib import Path
 from PIL import Image
 
@@ -17,7 +19,88 @@ DEFAULT_SIZE = "128x128"
 DEFAULT_COUNT = 5
 DEFAULT_DETALIZATION = 256
 
-def main(texture_file, count, size, output_prefix="sprite", detalization=DEFAULT_DETALIZATION):
+# Renderer state of a worker process, set up once by _init_worker()
+_plotter = None
+_camera = None
+
+
+def _init_worker(texture_file, width, height, detalization, headlight=False):
+    """Create textured sphere and plotter shared by all sprites of a worker process."""
+    global _plotter, _camera
+
+    tex = pv.read_texture(texture_file)
+
+    # Create sphere with texture, it is the same for all sprites
+    sphere = pv.Sphere(
+        radius=1,
+        theta_resolution=detalization,
+        phi_resolution=detalization,
+        start_theta=270.001,
+        end_theta=270
+    )
+
+    # Manual UV coordinates to avoid duplication
+    points = sphere.points
+    sphere.active_texture_coordinates = np.stack([
+        0.5 + np.arctan2(-points[:, 0], points[:, 1]) / (2 * np.pi),
+        0.5 + np.arcsin(points[:, 2]) / np.pi,
+    ], axis=1)
+
+    # Create plotter once for all sprites with transparent background and aggressive anti-aliasing
+    lighting = 'none' if headlight else 'light kit'
+    _plotter = pv.Plotter(off_screen=True, window_size=(width, height), lighting=lighting)
+
+    # Single headlight keeps shading symmetric about the view axis, see main()
+    if headlight:
+        _plotter.add_light(pv.Light(light_type='headlight'))
+
+    # Enable multi-sample anti-aliasing with maximum samples
+    _plotter.enable_anti_aliasing('msaa', multi_samples=8)
+
+    # Enable SSAA (Super-sampling) for even better quality
+    _plotter.enable_anti_aliasing('ssaa')
+
+    # Add sphere with texture and smooth shading
+    _plotter.add_mesh(sphere, texture=tex, smooth_shading=True)
+
+    # Enable depth peeling for better transparency (more layers)
+    _plotter.enable_depth_peeling(number_of_peels=10)
+
+    # Black background leaves the ball's own colors premultiplied by alpha at the edges,
+    # instead of blending the default white background into them
+    _plotter.set_background('black')
+
+    _camera = _plotter.camera.copy()
+
+    # Free the render window when the worker process exits, pool workers leave with
+    # os._exit() and skip atexit handlers, multiprocessing finalizers still run
+    util.Finalize(_plotter, _plotter.close, exitpriority=0)
+
+
+def _render_one(roll, elevation, sprite_name):
+    """Render one sprite with the plotter of the current worker process."""
+    # Start every sprite from the same camera, camera settings below are relative
+    _plotter.camera = _camera.copy()
+
+    # Set camera rotation
+    _plotter.camera.roll = -roll
+    _plotter.camera.elevation = -elevation
+    _plotter.camera.zoom(1.2)  # Slightly zoom in
+
+    # Render directly at target resolution, anti-aliasing is done by the plotter
+    _plotter.render()  # screenshot() does not re-render an already rendered window
+    img = _plotter.screenshot(transparent_background=True, return_img=True)
+
+    # Un-premultiply colors by alpha, fully transparent pixels stay (0, 0, 0, 0)
+    alpha = img[..., 3:].astype(np.float64)
+    rgb = np.where(alpha > 0, img[..., :3].astype(np.float64) * 255 / np.maximum(alpha, 1), 0)
+    img[..., :3] = np.minimum(np.rint(rgb), 255).astype(np.uint8)
+    Image.fromarray(img).save(sprite_name)
+    return sprite_name
+
+
+def main(texture_file, count, size, output_prefix="sprite", detalization=DEFAULT_DETALIZATION, jobs=None,
+         exploit_symmetry=False):
     """Generate NxN sphere sprite renders with texture rotation."""
     print(f"Loading texture: {texture_file}")
     print(f"Generating {count}x{count} sprite map")
@@ -25,6 +108,13 @@ def main(texture_file, count, size, output_prefix="sprite", detalization=DEFAULT
     print(f"Detalization: {detalization}")
     print(f"Output prefix: {output_prefix}")
 
+    # Sprites only pair up for an even count, otherwise render all of them as usual
+    if exploit_symmetry and count % 2 != 0:
+        print("Exploit symmetry: skipped, sprite count is odd")
+        exploit_symmetry = False
+    elif exploit_symmetry:
+        print("Exploit symmetry: on (headlight only)")
+
     # Parse size argument
     if 'x' in size:
         width, height = map(int, size.split('x'))
@@ -35,102 +125,74 @@ def main(texture_file, count, size, output_prefix="sprite", detalization=DEFAULT
     # Create output directory structure from prefix path
     Path(output_prefix).parent.mkdir(parents=True, exist_ok=True)
 
-    # Load texture
+    # Check texture, worker processes load it on their own
     try:
-        tex = pv.read_texture(texture_file)
+        pv.read_texture(texture_file)
     except:
         print(f"Error: Could not load texture file '{texture_file}'")
         sys.exit(1)
 
-    # Generate NxN sprite variations with different rotation combinations
+    # Generate NxN sprite variations with different rotation combinations,
+    # sprites are independent and rendered in parallel
     roll_step = 360 / count
     elevation_step = 360 / count
 
-    for i in range(count):
-        for j in range(count):
-            roll = j * roll_step
-            elevation = i * elevation_step
-
-            sprite_name = f"{output_prefix}_{i+1:02d}_{j+1:02d}.png"
-            print(f"  Generating: {sprite_name} (roll: {roll:.1f}°, elevation: {elevation:.1f}°)")
-
-            # Create sphere with texture
-            sphere = pv.Sphere(
-                radius=1,
-                theta_resolution=detalization,
-                phi_resolution=detalization,
-                start_theta=270.001,
-                end_theta=270
-            )
-
-            # Manual UV coordinates to avoid duplication
-            sphere.active_texture_coordinates = np.zeros((sphere.points.shape[0], 2))
-            for k in range(sphere.points.shape[0]):
-                sphere.active_texture_coordinates[k] = [
-                    0.5 + np.arctan2(-sphere.points[k, 0], sphere.points[k, 1]) / (2 * np.pi),
-                    0.5 + np.arcsin(sphere.points[k, 2]) / np.pi,
-                ]
-
-            # Create plotter with transparent background and aggressive anti-aliasing
-            plotter = pv.Plotter(off_screen=True, window_size=(width * 2, height * 2))  # Render at 2x resolution
-
-            # Enable multi-sample anti-aliasing with maximum samples
-            plotter.enable_anti_aliasing('msaa', multi_samples=8)
-
-            # Enable SSAA (Super-sampling) for even better quality
-            plotter.enable_anti_aliasing('ssaa')
-
-            # Add sphere with texture and smooth shading
-            plotter.add_mesh(sphere, texture=tex, smooth_shading=True)
-
-            # Enable depth peeling for better transparency (more layers)
-            plotter.enable_depth_peeling(number_of_peels=10)
-
-            # Set camera rotation
-            plotter.camera.roll = -roll
-            plotter.camera.elevation = -elevation
-            plotter.camera.zoom(1.2)  # Slightly zoom in
-
-            # Render at high resolution then downscale for better quality
-            temp_name = f"{output_prefix}_{i+1:02d}_{j+1:02d}.temp.png"
-            plotter.screenshot(temp_name, transparent_background=True)
-            plotter.close()
-
-            # Downscale from 2x to target resolution with high-quality resampling
-            img = Image.open(temp_name)
-            img_resized = img.resize((width, height), Image.Resampling.LANCZOS)
-            img_resized.save(sprite_name)
-            Path(temp_name).unlink()
+    # Sprite (i, j) and sprite (-i, j + count/2) look at the ball from the same point with
+    # the camera upside down, so with lighting symmetric about the view axis one of them is
+    # the other rotated by 180°. Render the first sprite of each pair, derive the second one
+    mirrors = {}
+    if exploit_symmetry:
+        for i in range(count):
+            for j in range(count):
+                source = ((count - i) % count, (j + count // 2) % count)
+                if source < (i, j):
+                    mirrors[source] = (i, j)
+
+    init_args = (texture_file, width, height, detalization, exploit_symmetry)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=init_args) as executor:
+        futures = {}
+        for i in range(count):
+            for j in range(count):
+                if (i, j) in mirrors.values():
+                    continue
+
+                roll = j * roll_step
+                elevation = i * elevation_step
+
+                sprite_name = f"{output_prefix}_{i+1:02d}_{j+1:02d}.png"
+                print(f"  Generating: {sprite_name} (roll: {roll:.1f}°, elevation: {elevation:.1f}°)")
+                futures[executor.submit(_render_one, roll, elevation, sprite_name)] = (i, j)
+
+        for future in as_completed(futures):
+            sprite_name = future.result()
+            print(f"  Created: {sprite_name}")
+
+            if futures[future] in mirrors:
+                i, j = mirrors[futures[future]]
+                mirror_name = f"{output_prefix}_{i+1:02d}_{j+1:02d}.png"
+                Image.open(sprite_name).transpose(Image.Transpose.ROTATE_180).save(mirror_name)
+                print(f"  Created: {mirror_name} (rotated {sprite_name})")
 
     # Create composite images with all sprites
     print("Creating composite images...")
 
-    # Create big image for all sprites (count x count grid)
-    composite_width = width * count
-    composite_height = height * count
-
-    # Transparent background composite
-    composite_transparent = Image.new('RGBA', (composite_width, composite_height), (0, 0, 0, 0))
-
-    # Green background composite
-    composite_green = Image.new('RGB', (composite_width, composite_height), (0, 128, 0))
+    # Create big RGBA array for all sprites (count x count grid)
+    composite = np.empty((height * count, width * count, 4), dtype=np.uint8)
 
     # Place each sprite in the grid
     for i in range(count):
         for j in range(count):
             sprite_file = f"{output_prefix}_{i+1:02d}_{j+1:02d}.png"
-            sprite_img = Image.open(sprite_file)
-
-            x_pos = j * width
-            y_pos = i * height
+            sprite = np.asarray(Image.open(sprite_file).convert('RGBA'))
+            composite[i * height:(i + 1) * height, j * width:(j + 1) * width] = sprite
 
-            # Add to transparent composite
-            composite_transparent.paste(sprite_img, (x_pos, y_pos), sprite_img)
+    # Transparent background composite
+    composite_transparent = Image.fromarray(composite)
 
-            # Add to green composite (convert RGBA to RGB for green background)
-            sprite_rgb = Image.new('RGB', sprite_img.size, (0, 128, 0))
-            sprite_rgb.paste(sprite_img, mask=sprite_img.split()[-1])  # Use alpha as mask
-            composite_green.paste(sprite_rgb, (x_pos, y_pos))
+    # Green background composite, blend all sprites over green using their alpha at once
+    alpha = composite[..., 3:] / 255
+    green = composite[..., :3] * alpha + np.array([0, 128, 0]) * (1 - alpha)
+    composite_green = Image.fromarray(np.rint(green).astype(np.uint8))
 
     # Save composite images
     composite_transparent.save(f"{output_prefix}.all.png")
@@ -149,6 +211,11 @@ if __name__ == '__main__':
                        help='Output filename prefix (default: sprite)')
     parser.add_argument('-d', '--detalization', type=int, default=DEFAULT_DETALIZATION,
                        help=f'Sphere detail level (default: {DEFAULT_DETALIZATION})')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                       help='Number of parallel render processes (default: number of CPUs)')
+    parser.add_argument('--exploit-symmetry', action='store_true',
+                       help='Derive half of the sprites by 180° rotation, lights with a headlight only (even count)')
     args = parser.parse_args()
 
-    main(args.texture_file, args.count, args.size, args.output_prefix, args.detalization)
+    main(args.texture_file, args.count, args.size, args.output_prefix, args.detalization, args.jobs,
+         args.exploit_symmetry)
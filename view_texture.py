@@ -27,13 +27,11 @@ def main(texture_file, detalization=DEFAULT_DETALIZATION):
     )
 
     # Manually calculate UV coordinates to avoid duplication
-    sphere.active_texture_coordinates = np.zeros((sphere.points.shape[0], 2))
-
-    for i in range(sphere.points.shape[0]):
-        sphere.active_texture_coordinates[i] = [
-            0.5 + np.arctan2(-sphere.points[i, 0], sphere.points[i, 1]) / (2 * np.pi),
-            0.5 + np.arcsin(sphere.points[i, 2]) / np.pi,
-        ]
+    points = sphere.points
+    sphere.active_texture_coordinates = np.stack([
+        0.5 + np.arctan2(-points[:, 0], points[:, 1]) / (2 * np.pi),
+        0.5 + np.arcsin(points[:, 2]) / np.pi,
+    ], axis=1)
 
     # Load texture
     try: